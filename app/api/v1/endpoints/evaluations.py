@@ -1,8 +1,8 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
-from app.schemas.evaluation import EvaluationCreate, EvaluationResponse, EvaluationSummary, EvaluationPut
+from app.schemas.evaluation import EvaluationCreate, EvaluationResponse, EvaluationSummary, EvaluationPut, EvaluationSearchPage
 from app.services.evaluation import EvaluationService
 from app.repositories.evaluation_repo import EvaluationRepository
 from app.dependencies.dependencies import get_service, get_llm_provider
@@ -26,6 +26,17 @@ async def get_evaluations(
 ):
     return await service.get_evaluations_for_contestant(contestant_id, llm_provider)
 
+@router.get("/evaluations/search", response_model=EvaluationSearchPage)
+async def search_evaluations(
+    q: str = Query(..., min_length=1),
+    judge_id: str | None = None,
+    contestant_id: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    service: EvaluationService = Depends(get_service)
+):
+    return await service.search_evaluations(q, limit, judge_id=judge_id, contestant_id=contestant_id, cursor=cursor)
+
 @router.put("/evaluations/{evaluation_id}", response_model=EvaluationResponse)
 async def update_evaluation(
     evaluation_id: UUID,
@@ -6,6 +6,12 @@ class Settings(BaseSettings):
     LLM_PROVIDER: str = "openai"
     LLM_BASE_URL: str = "https://api.openai.com/v1/chat/completions"
     LLM_MODEL: str = "gpt-3.5-turbo"
+    EVALUATION_WRITE_BEHIND: bool = False
+    EVALUATION_BATCH_MAX_SIZE: int = 100
+    EVALUATION_BATCH_MAX_DELAY_MS: int = 10
+    PROMPT_TOKEN_BUDGET: int = 1000
+    PROMPT_MAX_NOTE_TOKENS: int = 150
+    PROMPT_NEAR_DUPLICATE_THRESHOLD: float = 0.8
     
     model_config = SettingsConfigDict(
         env_file=".env",
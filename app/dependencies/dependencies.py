@@ -1,5 +1,6 @@
 from app.services.evaluation import EvaluationService
 from app.db.session import get_db
+from app.repositories.evaluation_batch_writer import evaluation_writer
 from app.services.llm.OllamaLLMProvider import OllamaLLMProvider
 from app.config.settings import settings
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,4 +15,5 @@ def get_llm_provider() -> OllamaLLMProvider:
 
 
 def get_service(session: AsyncSession = Depends(get_db)) -> EvaluationService:
-    return EvaluationService(session)
\ No newline at end of file
+    writer = evaluation_writer if evaluation_writer.is_running else None
+    return EvaluationService(session, writer)
\ No newline at end of file
@@ -3,6 +3,8 @@ from fastapi import FastAPI
 from sqlalchemy.exc import SQLAlchemyError
 from app.api.v1.endpoints import evaluations
 from app.db.session import engine, Base
+from app.repositories.evaluation_batch_writer import evaluation_writer
+from app.config.settings import settings
 from app.exceptions.handlers import database_exception_handler, generic_exception_handler, custom_exception_handler
 from app.exceptions.customExceptions.client_exceptions import CustomException, NotFoundError
 
@@ -10,7 +12,12 @@ from app.exceptions.customExceptions.client_exceptions import CustomException, N
 async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-    yield
+    if settings.EVALUATION_WRITE_BEHIND:
+        await evaluation_writer.start()
+    try:
+        yield
+    finally:
+        await evaluation_writer.stop()
 
 app = FastAPI(title="Judge Evaluation API", lifespan=lifespan)
 
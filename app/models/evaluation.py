@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Integer, Text, DateTime, Uuid
+from sqlalchemy import String, Integer, Text, DateTime, Uuid, DDL, event
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.session import Base
 
@@ -14,3 +14,37 @@ class Evaluation(Base):
     notes: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+# Full-text search over `notes`, kept outside the ORM mapping because each backend
+# indexes text differently: a generated `tsvector` column with a GIN index on
+# PostgreSQL, and an external-content FTS5 table keyed by `rowid` and maintained
+# by triggers on SQLite. Both stem English words so queries match alike.
+_FTS_DDL = {
+    "postgresql": [
+        "ALTER TABLE evaluations ADD COLUMN notes_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', notes)) STORED",
+        "CREATE INDEX ix_evaluations_notes_tsv ON evaluations USING GIN (notes_tsv)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE evaluations_fts USING fts5("
+        "notes, content='evaluations', content_rowid='rowid', tokenize='porter unicode61')",
+        "CREATE TRIGGER evaluations_fts_ai AFTER INSERT ON evaluations BEGIN "
+        "INSERT INTO evaluations_fts (rowid, notes) VALUES (new.rowid, new.notes); END",
+        "CREATE TRIGGER evaluations_fts_ad AFTER DELETE ON evaluations BEGIN "
+        "INSERT INTO evaluations_fts (evaluations_fts, rowid, notes) VALUES ('delete', old.rowid, old.notes); END",
+        "CREATE TRIGGER evaluations_fts_au AFTER UPDATE OF notes ON evaluations BEGIN "
+        "INSERT INTO evaluations_fts (evaluations_fts, rowid, notes) VALUES ('delete', old.rowid, old.notes); "
+        "INSERT INTO evaluations_fts (rowid, notes) VALUES (new.rowid, new.notes); END",
+    ],
+}
+
+for _dialect, _statements in _FTS_DDL.items():
+    for _statement in _statements:
+        event.listen(Evaluation.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+
+event.listen(
+    Evaluation.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS evaluations_fts").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.db.session import AsyncSessionLocal
+from app.models.evaluation import Evaluation
+from app.repositories.evaluation_repo import EvaluationRepository
+from app.schemas.evaluation import EvaluationCreate
+from app.exceptions.customExceptions.server_exceptions import ServerError
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class EvaluationBatchWriter:
+    """
+    Write-behind queue for evaluation inserts.
+
+    Callers submit single evaluations and await their persisted row, while a
+    background flusher writes everything queued within `max_delay_ms` (or up to
+    `max_batch_size` rows) as one multi-row insert in a single transaction. If
+    that insert is rejected because of its data, the batch is retried row by
+    row so one bad row only fails its own caller; any other failure fails the
+    whole batch immediately.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_batch_size: int = 100,
+        max_delay_ms: int = 10,
+    ):
+        self._session_factory = session_factory
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_delay = max(0, max_delay_ms) / 1000
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._closing
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+        self._closing = False
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop accepting new rows and wait until everything queued is flushed."""
+        if self._task is None:
+            return
+        self._closing = True
+        await self._queue.put(_STOP)
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            if not self._task.cancelled():
+                raise
+        self._task = None
+        self._queue = None
+
+    async def submit(self, evaluation_in: EvaluationCreate) -> Evaluation:
+        if not self.is_running:
+            raise ServerError("Evaluation writer is not running")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((evaluation_in, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        batch: list[tuple[EvaluationCreate, asyncio.Future]] = []
+        try:
+            while not stopping:
+                item = await self._queue.get()
+                if item is _STOP:
+                    break
+                batch = [item]
+                deadline = loop.time() + self._max_delay
+                while len(batch) < self._max_batch_size:
+                    timeout = deadline - loop.time()
+                    try:
+                        if timeout > 0:
+                            item = await asyncio.wait_for(self._queue.get(), timeout)
+                        else:
+                            item = self._queue.get_nowait()
+                    except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                        break
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    batch.append(item)
+                await self._flush(batch)
+                batch = []
+        finally:
+            self._fail_pending(batch)
+
+    def _fail_pending(self, batch: list[tuple[EvaluationCreate, asyncio.Future]]) -> None:
+        """Make sure no caller waits forever once the flusher has exited."""
+        pending = list(batch)
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                pending.append(item)
+        error = ServerError("Evaluation writer stopped before the evaluation was saved")
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _flush(self, batch: list[tuple[EvaluationCreate, asyncio.Future]]) -> None:
+        pending = [(data, future) for data, future in batch if not future.done()]
+        if not pending:
+            return
+        try:
+            async with self._session_factory() as session:
+                repo = EvaluationRepository(session)
+                db_objs = await repo.create_many([data for data, _ in pending])
+        except (IntegrityError, DataError):
+            # A single bad row rejects the whole statement; retry so only its caller fails.
+            logger.exception("Failed to flush %d queued evaluations, retrying one at a time", len(pending))
+            await self._flush_one_by_one(pending)
+            return
+        except Exception as e:
+            # Connection and other operational errors would hit every row again, so
+            # fail the batch at once instead of queueing a timeout per row.
+            logger.exception("Failed to flush %d queued evaluations", len(pending))
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), db_obj in zip(pending, db_objs):
+            if not future.done():
+                future.set_result(db_obj)
+
+    async def _flush_one_by_one(self, pending: list[tuple[EvaluationCreate, asyncio.Future]]) -> None:
+        for data, future in pending:
+            if future.done():
+                continue
+            try:
+                async with self._session_factory() as session:
+                    db_obj = await EvaluationRepository(session).create(data)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            if not future.done():
+                future.set_result(db_obj)
+
+
+evaluation_writer = EvaluationBatchWriter(
+    AsyncSessionLocal,
+    max_batch_size=settings.EVALUATION_BATCH_MAX_SIZE,
+    max_delay_ms=settings.EVALUATION_BATCH_MAX_DELAY_MS,
+)
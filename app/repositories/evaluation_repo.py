@@ -1,10 +1,15 @@
+import re
 import uuid
-from sqlalchemy import select, exists
+from sqlalchemy import select, exists, insert, func, and_, or_, literal_column, table, column
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.evaluation import Evaluation
 from app.schemas.evaluation import EvaluationCreate, EvaluationPut
+from app.exceptions.customExceptions.server_exceptions import ServerError
 from uuid import UUID
 
+_evaluations_fts = table("evaluations_fts", column("rowid"), column("notes"))
+
+
 class EvaluationRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -16,6 +21,13 @@ class EvaluationRepository:
         await self.session.refresh(db_obj)
         return db_obj
 
+    async def create_many(self, evaluations_in: list[EvaluationCreate]) -> list[Evaluation]:
+        stmt = insert(Evaluation).returning(Evaluation, sort_by_parameter_order=True)
+        result = await self.session.scalars(stmt, [ev.model_dump() for ev in evaluations_in])
+        db_objs = list(result.all())
+        await self.session.commit()
+        return db_objs
+
     async def get_by_contestant(self, contestant_id: str) -> list[Evaluation]:
         stmt = select(Evaluation).where(Evaluation.contestant_id == contestant_id)
         result = await self.session.execute(stmt)
@@ -44,4 +56,53 @@ class EvaluationRepository:
             return False
         await self.session.delete(db_obj)
         await self.session.commit()
-        return True
\ No newline at end of file
+        return True
+
+    async def search(
+        self,
+        query: str,
+        limit: int,
+        judge_id: str | None = None,
+        contestant_id: str | None = None,
+        after: tuple[float, UUID] | None = None,
+    ) -> list[tuple[Evaluation, float]]:
+        """
+        Ranked full-text search over notes, best match first.
+
+        `after` is the (rank, id) of the last row of the previous page; results
+        continue strictly after it in (rank DESC, id ASC) order. PostgreSQL ranks
+        depend only on the row, but SQLite's bm25 uses table-wide statistics, so
+        on SQLite pages may skip or repeat rows if evaluations are written between
+        requests.
+        """
+        dialect = self.session.bind.dialect.name
+        if dialect == "postgresql":
+            tsquery = func.websearch_to_tsquery(literal_column("'english'::regconfig"), query)
+            notes_tsv = literal_column("evaluations.notes_tsv")
+            rank = func.ts_rank_cd(notes_tsv, tsquery)
+            stmt = select(Evaluation, rank.label("rank")).where(notes_tsv.op("@@")(tsquery))
+        elif dialect == "sqlite":
+            terms = re.findall(r"\w+", query)
+            if not terms:
+                return []
+            fts_query = " ".join(f'"{term}"' for term in terms)
+            rank = -func.bm25(literal_column("evaluations_fts"))
+            stmt = (
+                select(Evaluation, rank.label("rank"))
+                .join(_evaluations_fts, _evaluations_fts.c.rowid == literal_column("evaluations.rowid"))
+                .where(literal_column("evaluations_fts").op("MATCH")(fts_query))
+            )
+        else:
+            raise ServerError(f"Full-text search is not supported on {dialect}")
+
+        if judge_id is not None:
+            stmt = stmt.where(Evaluation.judge_id == judge_id)
+        if contestant_id is not None:
+            stmt = stmt.where(Evaluation.contestant_id == contestant_id)
+        if after is not None:
+            after_rank, after_id = after
+            stmt = stmt.where(or_(rank < after_rank, and_(rank == after_rank, Evaluation.id > after_id)))
+
+        stmt = stmt.order_by(rank.desc(), Evaluation.id).limit(limit)
+        result = await self.session.execute(stmt)
+        return [(row.Evaluation, float(row.rank)) for row in result]
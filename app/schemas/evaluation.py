@@ -28,3 +28,10 @@ class EvaluationSummary(BaseModel):
     summary: str | None = None
     summary_error: str | None = None
     overall_score: int | None = None
+
+class EvaluationSearchHit(EvaluationResponse):
+    rank: float
+
+class EvaluationSearchPage(BaseModel):
+    results: list[EvaluationSearchHit]
+    next_cursor: str | None = None
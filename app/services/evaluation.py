@@ -1,20 +1,32 @@
+import base64
+import binascii
+import json
 import logging
+import math
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.evaluation_repo import EvaluationRepository
+from app.repositories.evaluation_batch_writer import EvaluationBatchWriter
 from app.services.llm.OllamaLLMProvider import OllamaLLMProvider
 from app.services.llm.base import LLMProvider   
-from app.schemas.evaluation import EvaluationCreate, EvaluationSummary
+from app.services.prompt_builder import EvaluationPromptBuilder
+from app.schemas.evaluation import EvaluationCreate, EvaluationSummary, EvaluationResponse, EvaluationSearchHit, EvaluationSearchPage
 from app.models.evaluation import Evaluation
 from uuid import UUID
-from app.exceptions.customExceptions.client_exceptions import NotFoundError
+from app.exceptions.customExceptions.client_exceptions import NotFoundError, ClientError
 from app.schemas.evaluation import EvaluationPut
 from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 class EvaluationService:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, writer: EvaluationBatchWriter | None = None):
         self.repo = EvaluationRepository(session)
+        self.writer = writer
+        self.prompt_builder = EvaluationPromptBuilder(
+            token_budget=settings.PROMPT_TOKEN_BUDGET,
+            max_note_tokens=settings.PROMPT_MAX_NOTE_TOKENS,
+            near_duplicate_threshold=settings.PROMPT_NEAR_DUPLICATE_THRESHOLD,
+        )
     
     @staticmethod
     def validate_and_return_data(evaluation_id: UUID, res: any) -> any:
@@ -22,7 +34,32 @@ class EvaluationService:
             raise NotFoundError(f"Evaluation {evaluation_id} not found")
         return res
 
+    @staticmethod
+    def encode_cursor(rank: float, evaluation_id: UUID) -> str:
+        raw = json.dumps({"rank": rank, "id": str(evaluation_id)})
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[float, UUID]:
+        try:
+            data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError):
+            raise ClientError("Invalid cursor")
+        if not isinstance(data, dict):
+            raise ClientError("Invalid cursor")
+        rank, evaluation_id = data.get("rank"), data.get("id")
+        if isinstance(rank, bool) or not isinstance(rank, (int, float)) or not math.isfinite(rank):
+            raise ClientError("Invalid cursor")
+        if not isinstance(evaluation_id, str):
+            raise ClientError("Invalid cursor")
+        try:
+            return float(rank), UUID(evaluation_id)
+        except ValueError:
+            raise ClientError("Invalid cursor")
+
     async def create_evaluation(self, data: EvaluationCreate) -> Evaluation:
+        if self.writer is not None:
+            return await self.writer.submit(data)
         return await self.repo.create(data)
     
     async def get_evaluation(self, evaluation_id: UUID) -> Evaluation | None:
@@ -38,11 +75,8 @@ class EvaluationService:
         total_evaluations = len(evaluations)
 
         if evaluations:
-            text_lines = []
-            for ev in evaluations:
-                text_lines.append(f"Judge {ev.judge_id} (Score: {ev.score}): {ev.notes}")
-                overall_score += ev.score
-            full_text = "\n".join(text_lines)
+            overall_score = sum(ev.score for ev in evaluations)
+            full_text = self.prompt_builder.build(evaluations)
             
             try:
                 summary = await llm_provider.summarize(full_text)
@@ -58,6 +92,31 @@ class EvaluationService:
             overall_score=overall_score/total_evaluations if total_evaluations > 0 else None
         )
     
+    async def search_evaluations(
+        self,
+        query: str,
+        limit: int,
+        judge_id: str | None = None,
+        contestant_id: str | None = None,
+        cursor: str | None = None,
+    ) -> EvaluationSearchPage:
+        after = self.decode_cursor(cursor) if cursor else None
+        rows = await self.repo.search(
+            query, limit + 1, judge_id=judge_id, contestant_id=contestant_id, after=after
+        )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_evaluation, last_rank = rows[-1]
+            next_cursor = self.encode_cursor(last_rank, last_evaluation.id)
+
+        results = [
+            EvaluationSearchHit(**EvaluationResponse.model_validate(ev).model_dump(), rank=rank)
+            for ev, rank in rows
+        ]
+        return EvaluationSearchPage(results=results, next_cursor=next_cursor)
+
     async def update_evaluation(self, evaluation_id: UUID, data: EvaluationPut) -> Evaluation:
         res = await self.repo.update(evaluation_id, data)
         return self.validate_and_return_data(evaluation_id, res)
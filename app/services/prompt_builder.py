@@ -0,0 +1,169 @@
+import random
+import re
+import statistics
+import zlib
+from app.models.evaluation import Evaluation
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_WORD_PATTERN = re.compile(r"\w+")
+_MIN_NOTE_TOKENS = 16
+
+# MinHash LSH for near-duplicate lookup: notes are split into bands of hashes and
+# only compared against kept notes sharing a band. Bands and rows are derived from
+# the threshold so a pair overlapping exactly at it still collides with at least
+# _MINHASH_RECALL probability. Below roughly 0.55 no banding within
+# _MINHASH_MAX_PERMUTATIONS filters usefully, so deduplication falls back to an
+# exact pairwise scan (still bounded by the token-budget early stop).
+_MINHASH_RECALL = 0.999
+_MINHASH_MIN_ROWS = 2
+_MINHASH_MAX_PERMUTATIONS = 48
+_MINHASH_PRIME = (1 << 61) - 1
+_minhash_rng = random.Random(0)
+_MINHASH_PERMUTATIONS = [
+    (_minhash_rng.randrange(1, _MINHASH_PRIME), _minhash_rng.randrange(_MINHASH_PRIME))
+    for _ in range(_MINHASH_MAX_PERMUTATIONS)
+]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough, tokenizer-free token count: one per word or punctuation mark."""
+    return len(_TOKEN_PATTERN.findall(text))
+
+
+class EvaluationPromptBuilder:
+    """
+    Builds the summarization input for a contestant's evaluations.
+
+    Notes are whitespace-normalized, exact and near-duplicate notes are dropped,
+    overly long notes are truncated, and the result is fit to `token_budget`.
+    Scores are reported once as a statistical header instead of per line.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 1000,
+        max_note_tokens: int = 150,
+        near_duplicate_threshold: float = 0.8,
+    ):
+        self.token_budget = token_budget
+        self.max_note_tokens = max(_MIN_NOTE_TOKENS, max_note_tokens)
+        if not 0 < near_duplicate_threshold <= 1:
+            raise ValueError("near_duplicate_threshold must be in (0, 1]")
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.minhash_banding = self.choose_banding(near_duplicate_threshold)
+
+    @staticmethod
+    def choose_banding(threshold: float) -> tuple[int, int] | None:
+        """Return (bands, rows) with the most rows per band that meets _MINHASH_RECALL, or None."""
+        for rows in range(_MINHASH_MAX_PERMUTATIONS, _MINHASH_MIN_ROWS - 1, -1):
+            for bands in range(1, _MINHASH_MAX_PERMUTATIONS // rows + 1):
+                if 1 - (1 - threshold ** rows) ** bands >= _MINHASH_RECALL:
+                    return bands, rows
+        return None
+
+    @staticmethod
+    def normalize(notes: str) -> str:
+        return " ".join(notes.split())
+
+    @staticmethod
+    def score_header(scores: list[int]) -> str:
+        header = (
+            f"Scores (n={len(scores)}): mean={statistics.mean(scores):.1f}, "
+            f"median={statistics.median(scores):g}, min={min(scores)}, max={max(scores)}"
+        )
+        if len(scores) > 1:
+            header += f", stdev={statistics.stdev(scores):.1f}"
+        return header
+
+    @staticmethod
+    def omitted_notice(count: int) -> str:
+        return f"({count} further notes omitted for length)"
+
+    @staticmethod
+    def truncate(notes: str, max_tokens: int) -> str:
+        matches = list(_TOKEN_PATTERN.finditer(notes))
+        if len(matches) <= max_tokens:
+            return notes
+        return notes[:matches[max_tokens - 1].end()] + " ..."
+
+    def minhash_bands(self, words: frozenset[str]) -> list[tuple[int, tuple[int, ...]]]:
+        if not words or self.minhash_banding is None:
+            return []
+        bands, rows = self.minhash_banding
+        hashes = [zlib.crc32(word.encode()) for word in words]
+        signature = [
+            min((a * h + b) % _MINHASH_PRIME for h in hashes)
+            for a, b in _MINHASH_PERMUTATIONS[:bands * rows]
+        ]
+        return [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(bands)]
+
+    @staticmethod
+    def jaccard(words: frozenset[str], other: frozenset[str]) -> float:
+        union = words | other
+        return len(words & other) / len(union) if union else 0.0
+
+    def deduplicate(self, entries: list[tuple[str, str]]) -> tuple[list[tuple[str, str]], int]:
+        """
+        Keep the first of any notes that are equal or whose word sets overlap above the threshold.
+
+        Stops once the kept notes could no longer fit `token_budget` even at the
+        minimum per-note length, and returns the kept notes together with the
+        number of trailing notes that were never examined.
+        """
+        kept: list[tuple[str, str]] = []
+        seen_exact: set[str] = set()
+        kept_words: list[frozenset[str]] = []
+        buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+        min_tokens = 0
+        for position, (judge_id, notes) in enumerate(entries):
+            if min_tokens > self.token_budget:
+                return kept, len(entries) - position
+            key = notes.lower()
+            if key in seen_exact:
+                continue
+            words = frozenset(_WORD_PATTERN.findall(key))
+            bands = self.minhash_bands(words)
+            if self.minhash_banding is None:
+                candidates = range(len(kept))
+            else:
+                candidates = {index for band in bands for index in buckets.get(band, ())}
+            if any(self.jaccard(words, kept_words[index]) >= self.near_duplicate_threshold for index in candidates):
+                continue
+            seen_exact.add(key)
+            for band in bands:
+                buckets.setdefault(band, []).append(len(kept))
+            kept_words.append(words)
+            kept.append((judge_id, notes))
+            min_tokens += estimate_tokens(f"Judge {judge_id}: {self.truncate(notes, _MIN_NOTE_TOKENS)}")
+        return kept, 0
+
+    def build(self, evaluations: list[Evaluation]) -> str:
+        if not evaluations:
+            return ""
+
+        header = self.score_header([ev.score for ev in evaluations])
+        entries, unexamined = self.deduplicate([
+            (ev.judge_id, notes)
+            for ev in evaluations
+            if (notes := self.normalize(ev.notes))
+        ])
+
+        # Shrink the per-note cap until everything fits, so every distinct note keeps
+        # some representation; only then drop trailing notes.
+        cap = self.max_note_tokens
+        while True:
+            lines = [f"Judge {judge_id}: {self.truncate(notes, cap)}" for judge_id, notes in entries]
+            total = estimate_tokens(header) + sum(estimate_tokens(line) for line in lines)
+            if total <= self.token_budget or cap <= _MIN_NOTE_TOKENS:
+                break
+            cap = max(_MIN_NOTE_TOKENS, cap * 3 // 4)
+
+        if total > self.token_budget or unexamined:
+            notice_tokens = estimate_tokens(self.omitted_notice(len(entries) + unexamined))
+            while lines and total + notice_tokens > self.token_budget:
+                total -= estimate_tokens(lines.pop())
+        omitted = len(entries) - len(lines) + unexamined
+        if omitted:
+            header += "\n" + self.omitted_notice(omitted)
+
+        return "\n".join([header, *lines])
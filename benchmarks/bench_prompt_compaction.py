@@ -0,0 +1,104 @@
+"""
+Prompt size and LLM latency before and after prompt compaction, using the
+evaluations in benchmarks/fixtures/evaluations.json.
+
+Usage:
+    python -m benchmarks.bench_prompt_compaction [--llm] [--token-budget 1000] [--scale 500 2000 4000]
+
+Sizes are always reported. With --llm, both prompts are also sent to the
+provider configured by LLM_MODEL / LLM_BASE_URL and the latency is timed.
+With --scale, the time to build a prompt from that many synthetic distinct
+notes is reported as well.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from app.config.settings import settings
+from app.services.prompt_builder import EvaluationPromptBuilder, estimate_tokens
+
+FIXTURES = Path(__file__).parent / "fixtures" / "evaluations.json"
+
+
+def raw_prompt(evaluations) -> str:
+    """The uncompacted format: one `Judge X (Score: N): notes` line per evaluation."""
+    return "\n".join(f"Judge {ev.judge_id} (Score: {ev.score}): {ev.notes}" for ev in evaluations)
+
+
+async def time_summarize(llm_provider, text: str) -> str:
+    start = time.perf_counter()
+    try:
+        await llm_provider.summarize(text)
+    except TimeoutError:
+        return "timeout"
+    except Exception as e:
+        return f"error ({type(e).__name__})"
+    return f"{time.perf_counter() - start:.2f}s"
+
+
+async def bench(use_llm: bool, builder: EvaluationPromptBuilder):
+    fixtures = json.loads(FIXTURES.read_text())
+    llm_provider = None
+    if use_llm:
+        from app.dependencies.dependencies import get_llm_provider
+        llm_provider = get_llm_provider()
+
+    header = f"{'contestant':<12}{'evals':>6}{'raw chars':>11}{'raw tok':>9}{'cmp chars':>11}{'cmp tok':>9}"
+    if use_llm:
+        header += f"{'raw llm':>12}{'cmp llm':>12}"
+    print(header)
+    for contestant_id, rows in fixtures.items():
+        evaluations = [SimpleNamespace(**row) for row in rows]
+        before = raw_prompt(evaluations)
+        after = builder.build(evaluations)
+        line = (
+            f"{contestant_id:<12}{len(evaluations):>6}{len(before):>11}{estimate_tokens(before):>9}"
+            f"{len(after):>11}{estimate_tokens(after):>9}"
+        )
+        if use_llm:
+            line += f"{await time_summarize(llm_provider, before):>12}{await time_summarize(llm_provider, after):>12}"
+        print(line)
+
+
+def bench_scale(builder: EvaluationPromptBuilder, sizes: list[int]):
+    rng = random.Random(42)
+    vocabulary = [f"w{i}" for i in range(3000)]
+    print(f"\n{'notes':>8}{'build ms':>10}")
+    for size in sizes:
+        evaluations = [
+            SimpleNamespace(judge_id=f"j{i}", score=rng.randrange(101), notes=" ".join(rng.choices(vocabulary, k=25)))
+            for i in range(size)
+        ]
+        start = time.perf_counter()
+        builder.build(evaluations)
+        print(f"{size:>8}{(time.perf_counter() - start) * 1000:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--llm", action="store_true", help="also time LLMProvider.summarize on both prompts")
+    parser.add_argument("--token-budget", type=int, default=settings.PROMPT_TOKEN_BUDGET)
+    parser.add_argument("--max-note-tokens", type=int, default=settings.PROMPT_MAX_NOTE_TOKENS)
+    parser.add_argument("--near-duplicate-threshold", type=float, default=settings.PROMPT_NEAR_DUPLICATE_THRESHOLD)
+    parser.add_argument("--scale", type=int, nargs="*", default=[], help="also time build() on this many synthetic notes")
+    args = parser.parse_args()
+
+    builder = EvaluationPromptBuilder(
+        token_budget=args.token_budget,
+        max_note_tokens=args.max_note_tokens,
+        near_duplicate_threshold=args.near_duplicate_threshold,
+    )
+    asyncio.run(bench(args.llm, builder))
+    if args.scale:
+        bench_scale(builder, args.scale)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Full-text search latency for GET /api/v1/evaluations/search as the
+`evaluations` table grows.
+
+Usage:
+    python -m benchmarks.bench_search [--sizes 1000 10000 100000] [--queries 50] [--database-url URL]
+
+Defaults to a temporary SQLite file; pass a postgresql+asyncpg URL to measure
+the tsvector/GIN path. The table is dropped and reseeded for every size.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from app.db.session import Base
+from app.repositories.evaluation_repo import EvaluationRepository
+from app.schemas.evaluation import EvaluationCreate
+
+VOCABULARY = (
+    "stage presence energy diction breath control tone vibrato rhythm timing "
+    "confidence choreography costume range projection phrasing harmony dynamics"
+).split()
+RARE_TERMS = ["pacing", "intonation"]
+
+
+def make_notes(rng: random.Random) -> str:
+    words = rng.choices(VOCABULARY, k=12)
+    if rng.random() < 0.01:
+        words[rng.randrange(len(words))] = rng.choice(RARE_TERMS)
+    return " ".join(words)
+
+
+async def seed(session_factory, size: int, rng: random.Random):
+    batch_size = 1000
+    async with session_factory() as session:
+        repo = EvaluationRepository(session)
+        for start in range(0, size, batch_size):
+            await repo.create_many([
+                EvaluationCreate(
+                    contestant_id=f"c{rng.randrange(size // 10 + 1)}",
+                    judge_id=f"j{rng.randrange(20)}",
+                    score=rng.randrange(101),
+                    notes=make_notes(rng),
+                )
+                for _ in range(min(batch_size, size - start))
+            ])
+
+
+async def bench(database_url: str, sizes: list[int], queries: int):
+    connect_args = {"timeout": 30} if database_url.startswith("sqlite") else {}
+    engine = create_async_engine(database_url, connect_args=connect_args)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+    rng = random.Random(42)
+
+    print(f"{'rows':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for size in sizes:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        await seed(session_factory, size, rng)
+
+        timings = []
+        async with session_factory() as session:
+            repo = EvaluationRepository(session)
+            for i in range(queries):
+                start = time.perf_counter()
+                await repo.search(RARE_TERMS[i % len(RARE_TERMS)], 20)
+                timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(f"{size:>10}{statistics.median(timings):>10.2f}{p95:>10.2f}")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+        asyncio.run(bench(database_url, args.sizes, args.queries))
+
+
+if __name__ == "__main__":
+    main()
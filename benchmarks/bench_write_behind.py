@@ -0,0 +1,90 @@
+"""
+Sustained insert throughput for POST /api/v1/evaluations, with and without
+write-behind batching.
+
+Usage:
+    python -m benchmarks.bench_write_behind [--clients 50] [--seconds 5] [--database-url URL]
+
+Defaults to a temporary SQLite file; pass a postgresql+asyncpg URL to measure
+against a real server. The `evaluations` table is created if missing.
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from app.db.session import Base
+from app.repositories.evaluation_batch_writer import EvaluationBatchWriter
+from app.schemas.evaluation import EvaluationCreate
+from app.services.evaluation import EvaluationService
+
+
+def make_payload(client_id: int, seq: int) -> EvaluationCreate:
+    return EvaluationCreate(
+        contestant_id=f"c{seq % 200}",
+        judge_id=f"j{client_id}",
+        score=seq % 101,
+        notes="Strong stage presence; pacing drifted in the second half.",
+    )
+
+
+async def run_clients(session_factory, writer, clients: int, seconds: float) -> int:
+    deadline = time.perf_counter() + seconds
+    counts = [0] * clients
+
+    async def client(client_id: int):
+        seq = 0
+        while time.perf_counter() < deadline:
+            async with session_factory() as session:
+                service = EvaluationService(session, writer)
+                await service.create_evaluation(make_payload(client_id, seq))
+            seq += 1
+        counts[client_id] = seq
+
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    return sum(counts)
+
+
+async def bench(database_url: str, clients: int, seconds: float, batch_size: int, delay_ms: int):
+    connect_args = {"timeout": 30} if database_url.startswith("sqlite") else {}
+    engine = create_async_engine(database_url, connect_args=connect_args)
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    print(f"{'mode':<14}{'rows':>10}{'rows/s':>12}")
+    for mode in ("direct", "write-behind"):
+        writer = None
+        if mode == "write-behind":
+            writer = EvaluationBatchWriter(session_factory, max_batch_size=batch_size, max_delay_ms=delay_ms)
+            await writer.start()
+        start = time.perf_counter()
+        rows = await run_clients(session_factory, writer, clients, seconds)
+        if writer is not None:
+            await writer.stop()
+        elapsed = time.perf_counter() - start
+        print(f"{mode:<14}{rows:>10}{rows / elapsed:>12.0f}")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--delay-ms", type=int, default=10)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+        asyncio.run(bench(database_url, args.clients, args.seconds, args.batch_size, args.delay_ms))
+
+
+if __name__ == "__main__":
+    main()
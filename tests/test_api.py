@@ -60,3 +60,74 @@ async def test_delete_evaluation(client: AsyncClient):
     # Verify connection
     get_resp = await client.put(f"/api/v1/evaluations/{eval_id}", json=create_payload)
     assert get_resp.status_code == 404
+
+@pytest.mark.asyncio
+async def test_search_evaluations(client: AsyncClient):
+    payloads = [
+        {"contestant_id": "c5", "judge_id": "j1", "score": 70, "notes": "Pacing was rushed, pacing needs work"},
+        {"contestant_id": "c5", "judge_id": "j2", "score": 80, "notes": "Great intonation, slight pacing issues"},
+        {"contestant_id": "c6", "judge_id": "j1", "score": 90, "notes": "Flawless intonation"},
+    ]
+    for payload in payloads:
+        await client.post("/api/v1/evaluations", json=payload)
+
+    response = await client.get("/api/v1/evaluations/search?q=pacing")
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["judge_id"] for r in data["results"]] == ["j1", "j2"]
+    assert data["results"][0]["rank"] >= data["results"][1]["rank"]
+    assert data["next_cursor"] is None
+
+    response = await client.get("/api/v1/evaluations/search?q=intonation&judge_id=j1")
+    data = response.json()
+    assert len(data["results"]) == 1
+    assert data["results"][0]["contestant_id"] == "c6"
+
+    response = await client.get("/api/v1/evaluations/search?q=intonation&contestant_id=c5")
+    data = response.json()
+    assert len(data["results"]) == 1
+    assert data["results"][0]["judge_id"] == "j2"
+
+@pytest.mark.asyncio
+async def test_search_evaluations_pagination(client: AsyncClient):
+    for i in range(5):
+        payload = {"contestant_id": "c7", "judge_id": f"j{i}", "score": 50 + i, "notes": "Steady pacing throughout"}
+        await client.post("/api/v1/evaluations", json=payload)
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/api/v1/evaluations/search?q=pacing&limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = (await client.get(url)).json()
+        seen.extend(r["id"] for r in data["results"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+@pytest.mark.asyncio
+async def test_search_reflects_updates_and_deletes(client: AsyncClient):
+    create_payload = {"contestant_id": "c8", "judge_id": "j1", "score": 60, "notes": "Weak intonation"}
+    eval_id = (await client.post("/api/v1/evaluations", json=create_payload)).json()["id"]
+
+    update_payload = {**create_payload, "notes": "Improved diction"}
+    await client.put(f"/api/v1/evaluations/{eval_id}", json=update_payload)
+    assert (await client.get("/api/v1/evaluations/search?q=intonation")).json()["results"] == []
+    assert len((await client.get("/api/v1/evaluations/search?q=diction")).json()["results"]) == 1
+
+    await client.delete(f"/api/v1/evaluations/{eval_id}")
+    assert (await client.get("/api/v1/evaluations/search?q=diction")).json()["results"] == []
+
+@pytest.mark.asyncio
+async def test_search_matches_word_stems(client: AsyncClient):
+    payload = {"contestant_id": "c9", "judge_id": "j1", "score": 70, "notes": "The song was paced unevenly"}
+    await client.post("/api/v1/evaluations", json=payload)
+
+    response = await client.get("/api/v1/evaluations/search?q=pacing")
+    data = response.json()
+    assert len(data["results"]) == 1
+    assert data["results"][0]["contestant_id"] == "c9"
@@ -1,3 +1,6 @@
+import base64
+import json
+import uuid
 import pytest
 from httpx import AsyncClient
 from unittest.mock import AsyncMock
@@ -72,3 +75,22 @@ async def test_api_both_db_and_llm_error(client: AsyncClient):
 
     assert response.status_code == 500
     assert response.json()["detail"] == "Internal Database Error"
+
+@pytest.mark.asyncio
+async def test_api_search_invalid_cursor(client: AsyncClient):
+    def encode(data) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+    cursors = [
+        "not-a-cursor",
+        encode({"rank": 1, "id": 123}),
+        encode({"rank": "1", "id": str(uuid.uuid4())}),
+        encode({"rank": 1, "id": "not-a-uuid"}),
+        encode([1, "id"]),
+        encode({"id": str(uuid.uuid4())}),
+    ]
+    for cursor in cursors:
+        response = await client.get("/api/v1/evaluations/search", params={"q": "pacing", "cursor": cursor})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
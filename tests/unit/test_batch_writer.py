@@ -0,0 +1,157 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError, OperationalError
+from app.models.evaluation import Evaluation
+from app.repositories.evaluation_batch_writer import EvaluationBatchWriter
+from app.exceptions.customExceptions.server_exceptions import ServerError
+from app.schemas.evaluation import EvaluationCreate
+from app.services.evaluation import EvaluationService
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_resolves_each_caller_with_its_row(db_session):
+    writer = EvaluationBatchWriter(TestingSessionLocal, max_batch_size=50, max_delay_ms=20)
+    await writer.start()
+
+    payloads = [
+        EvaluationCreate(contestant_id="c1", judge_id=f"j{i}", score=i, notes=f"Note {i}")
+        for i in range(10)
+    ]
+    rows = await asyncio.gather(*(writer.submit(p) for p in payloads))
+    await writer.stop()
+
+    for payload, row in zip(payloads, rows):
+        assert row.judge_id == payload.judge_id
+        assert row.score == payload.score
+        assert row.id is not None
+        assert row.created_at is not None
+
+    count = await db_session.scalar(select(func.count()).select_from(Evaluation))
+    assert count == 10
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_flushes_in_batches_of_max_size(db_session):
+    writer = EvaluationBatchWriter(TestingSessionLocal, max_batch_size=4, max_delay_ms=1000)
+    await writer.start()
+
+    payload = EvaluationCreate(contestant_id="c1", judge_id="j1", score=90, notes="Good")
+    rows = await asyncio.wait_for(
+        asyncio.gather(*(writer.submit(payload) for _ in range(8))), timeout=0.5
+    )
+    await writer.stop()
+
+    assert len({row.id for row in rows}) == 8
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_drains_queue_on_stop(db_session):
+    writer = EvaluationBatchWriter(TestingSessionLocal, max_batch_size=100, max_delay_ms=10_000)
+    await writer.start()
+
+    payload = EvaluationCreate(contestant_id="c1", judge_id="j1", score=90, notes="Good")
+    tasks = [asyncio.create_task(writer.submit(payload)) for _ in range(3)]
+    await asyncio.sleep(0)
+    await writer.stop()
+
+    rows = await asyncio.gather(*tasks)
+    assert len(rows) == 3
+    assert not writer.is_running
+    with pytest.raises(ServerError):
+        await writer.submit(payload)
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_retries_rows_individually_when_batch_fails(db_session):
+    writer = EvaluationBatchWriter(TestingSessionLocal, max_batch_size=10, max_delay_ms=10)
+    await writer.start()
+
+    payload = EvaluationCreate(contestant_id="c1", judge_id="j1", score=90, notes="Good")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "app.repositories.evaluation_repo.EvaluationRepository.create_many",
+            AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("constraint failed"))),
+        )
+        rows = await asyncio.gather(*(writer.submit(payload) for _ in range(3)))
+
+    await writer.stop()
+
+    assert len({row.id for row in rows}) == 3
+    count = await db_session.scalar(select(func.count()).select_from(Evaluation))
+    assert count == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_propagates_row_failure_after_retry(db_session):
+    writer = EvaluationBatchWriter(TestingSessionLocal, max_batch_size=10, max_delay_ms=1)
+    await writer.start()
+
+    payload = EvaluationCreate(contestant_id="c1", judge_id="j1", score=90, notes="Good")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "app.repositories.evaluation_repo.EvaluationRepository.create_many",
+            AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("constraint failed"))),
+        )
+        mp.setattr(
+            "app.repositories.evaluation_repo.EvaluationRepository.create",
+            AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("constraint failed"))),
+        )
+        with pytest.raises(IntegrityError):
+            await writer.submit(payload)
+
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_fails_whole_batch_on_connection_error(db_session):
+    writer = EvaluationBatchWriter(TestingSessionLocal, max_batch_size=10, max_delay_ms=10)
+    await writer.start()
+
+    payload = EvaluationCreate(contestant_id="c1", judge_id="j1", score=90, notes="Good")
+    create = AsyncMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "app.repositories.evaluation_repo.EvaluationRepository.create_many",
+            AsyncMock(side_effect=OperationalError("INSERT", {}, Exception("connection refused"))),
+        )
+        mp.setattr("app.repositories.evaluation_repo.EvaluationRepository.create", create)
+        results = await asyncio.gather(
+            *(writer.submit(payload) for _ in range(3)), return_exceptions=True
+        )
+
+    await writer.stop()
+
+    assert all(isinstance(r, OperationalError) for r in results)
+    create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_writer_fails_pending_callers_when_flusher_is_cancelled(db_session):
+    writer = EvaluationBatchWriter(TestingSessionLocal, max_batch_size=100, max_delay_ms=10_000)
+    await writer.start()
+
+    payload = EvaluationCreate(contestant_id="c1", judge_id="j1", score=90, notes="Good")
+    tasks = [asyncio.create_task(writer.submit(payload)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    writer._task.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=1)
+    assert all(isinstance(r, ServerError) for r in results)
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_create_evaluation_uses_writer_when_enabled():
+    mock_session = AsyncMock()
+    writer = AsyncMock()
+    service = EvaluationService(mock_session, writer)
+    service.repo = AsyncMock()
+
+    payload = EvaluationCreate(contestant_id="c1", judge_id="j1", score=90, notes="Good")
+    await service.create_evaluation(payload)
+
+    writer.submit.assert_called_once_with(payload)
+    service.repo.create.assert_not_called()
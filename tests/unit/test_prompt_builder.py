@@ -0,0 +1,153 @@
+import pytest
+from unittest.mock import MagicMock
+from app.services.prompt_builder import EvaluationPromptBuilder, estimate_tokens
+
+
+def make_eval(judge_id: str, score: int, notes: str):
+    mock_eval = MagicMock()
+    mock_eval.judge_id = judge_id
+    mock_eval.score = score
+    mock_eval.notes = notes
+    return mock_eval
+
+
+def test_build_normalizes_whitespace_and_adds_score_header():
+    builder = EvaluationPromptBuilder()
+    evaluations = [
+        make_eval("j1", 80, "  Strong   opening,\n\nweak ending. "),
+        make_eval("j2", 90, "Excellent diction"),
+    ]
+
+    prompt = builder.build(evaluations)
+
+    lines = prompt.split("\n")
+    assert lines[0] == "Scores (n=2): mean=85.0, median=85, min=80, max=90, stdev=7.1"
+    assert lines[1] == "Judge j1: Strong opening, weak ending."
+    assert lines[2] == "Judge j2: Excellent diction"
+    assert "Score:" not in prompt
+
+
+def test_build_drops_exact_and_near_duplicates():
+    builder = EvaluationPromptBuilder(near_duplicate_threshold=0.8)
+    evaluations = [
+        make_eval("j1", 80, "Great stage presence but pacing was rushed in the second half"),
+        make_eval("j2", 82, "great stage presence but pacing was rushed in the second half"),
+        make_eval("j3", 81, "Great stage presence, but the pacing was rushed in the second half!"),
+        make_eval("j4", 60, "Intonation drifted flat on the sustained notes"),
+    ]
+
+    prompt = builder.build(evaluations)
+
+    assert "Judge j1:" in prompt
+    assert "Judge j2:" not in prompt
+    assert "Judge j3:" not in prompt
+    assert "Judge j4:" in prompt
+    assert prompt.startswith("Scores (n=4)")
+
+
+def test_build_truncates_outlier_notes():
+    builder = EvaluationPromptBuilder(max_note_tokens=20)
+    long_notes = " ".join(f"word{i}" for i in range(500))
+    evaluations = [make_eval("j1", 70, long_notes), make_eval("j2", 75, "Short note")]
+
+    prompt = builder.build(evaluations)
+
+    assert "word19 ..." in prompt
+    assert "word20" not in prompt
+    assert "Judge j2: Short note" in prompt
+
+
+def test_build_fits_token_budget():
+    builder = EvaluationPromptBuilder(token_budget=120, max_note_tokens=150)
+    evaluations = [
+        make_eval(f"j{i}", 50 + i, f"Judge {i} unique remark " + " ".join(f"t{i}x{k}" for k in range(40)))
+        for i in range(10)
+    ]
+
+    prompt = builder.build(evaluations)
+
+    assert estimate_tokens(prompt) <= 120
+    assert "further notes omitted for length" in prompt
+    assert "Judge j0:" in prompt
+
+
+def test_deduplicate_stops_once_budget_is_full():
+    builder = EvaluationPromptBuilder(token_budget=1000)
+    # Each line costs 3 tokens for "Judge jN:" plus 16 for the minimum-length note.
+    entries = [(f"j{i}", " ".join(f"w{i}x{k}" for k in range(25))) for i in range(4000)]
+
+    kept, unexamined = builder.deduplicate(entries)
+
+    assert unexamined > 0
+    assert len(kept) <= 1000 // 19 + 1
+    assert len(kept) + unexamined == 4000
+
+
+def test_build_counts_unexamined_notes_as_omitted():
+    builder = EvaluationPromptBuilder(token_budget=1000)
+    evaluations = [
+        make_eval(f"j{i}", i % 101, " ".join(f"w{i}x{k}" for k in range(25)))
+        for i in range(400)
+    ]
+
+    prompt = builder.build(evaluations)
+
+    assert estimate_tokens(prompt) <= 1000
+    shown = prompt.count("Judge ")
+    assert f"({400 - shown} further notes omitted for length)" in prompt
+
+
+def test_deduplicate_only_compares_bucket_collisions(monkeypatch):
+    builder = EvaluationPromptBuilder(token_budget=10**9, near_duplicate_threshold=0.8)
+    entries = [(f"j{i}", " ".join(f"w{i}x{k}" for k in range(20))) for i in range(2000)]
+    calls = 0
+    jaccard = EvaluationPromptBuilder.jaccard
+
+    def counting_jaccard(words, other):
+        nonlocal calls
+        calls += 1
+        return jaccard(words, other)
+
+    monkeypatch.setattr(builder, "jaccard", counting_jaccard)
+    kept, _ = builder.deduplicate(entries)
+
+    assert len(kept) == 2000
+    # An all-pairs scan would make ~2,000,000 comparisons.
+    assert calls < 2000
+
+
+def test_deduplicate_catches_pairs_exactly_at_threshold():
+    for threshold in (0.5, 0.6, 0.7, 0.8, 0.9):
+        builder = EvaluationPromptBuilder(token_budget=10**9, near_duplicate_threshold=threshold)
+        common_size = round(20 * threshold)
+        extra_size = (20 - common_size) // 2
+        entries = []
+        for i in range(200):
+            common = [f"p{i}c{k}" for k in range(common_size)]
+            entries.append(("a", " ".join(common + [f"p{i}a{k}" for k in range(extra_size)])))
+            entries.append(("b", " ".join(common + [f"p{i}b{k}" for k in range(20 - common_size - extra_size)])))
+
+        kept, _ = builder.deduplicate(entries)
+
+        assert len(kept) == 200, threshold
+
+
+def test_invalid_near_duplicate_threshold():
+    for threshold in (0, -0.5, 1.5):
+        with pytest.raises(ValueError):
+            EvaluationPromptBuilder(near_duplicate_threshold=threshold)
+
+
+def test_deduplicate_collapses_many_near_duplicates():
+    builder = EvaluationPromptBuilder(token_budget=10**9)
+    base = " ".join(f"word{k}" for k in range(30))
+    entries = [(f"j{i}", f"{base} extra{i % 3}") for i in range(3000)]
+
+    kept, unexamined = builder.deduplicate(entries)
+
+    assert len(kept) == 1
+    assert unexamined == 0
+
+
+def test_build_empty():
+    assert EvaluationPromptBuilder().build([]) == ""